@@ -36,21 +36,37 @@ PLAIN_TEXT_TYPE = "PlainText"
 RICH_TEXT_TYPE = "RichText"
 """str: Helper variable for rich text type."""
 
+_SPEAK_OPEN = "<speak>"
+_SPEAK_CLOSE = "</speak>"
+_SPEAK_OPEN_LEN = len(_SPEAK_OPEN)
+_SPEAK_CLOSE_LEN = len(_SPEAK_CLOSE)
+_EMPTY_SSML = _SPEAK_OPEN + _SPEAK_CLOSE
+
+_VIDEO_APP_LAUNCH_TYPE = "VideoApp.Launch"
+
+_TEXT_TYPE_CLASSES = {
+    PLAIN_TEXT_TYPE: PlainText,
+    RICH_TEXT_TYPE: RichText
+}
+
+_TEXT_CONTENT_FIELDS = ("primary_text", "secondary_text", "tertiary_text")
+
 
 class ResponseFactory(object):
     """ResponseFactory is class which provides helper functions to help
     building a response.
     """
+    __slots__ = ("response", "_has_video_launch")
 
     def __init__(self):
         # type: () -> None
         """The ResponseFactory has property Response with all
-        parameters initialized to None.
+        parameters initialized to None. Whether a video app launch
+        directive has been added is tracked separately, so that it
+        needn't be looked up in the directives on every call.
         """
-        self.response = Response(
-            output_speech=None, card=None, reprompt=None,
-            directives=None, should_end_session=None,
-            can_fulfill_intent=None)
+        self.response = Response()
+        self._has_video_launch = False
 
     def speak(self, speech, play_behavior=None):
         # type: (str, PlayBehavior) -> 'ResponseFactory'
@@ -65,8 +81,7 @@ class ResponseFactory(object):
             access from self.response.
         :rtype: ResponseFactory
         """
-        ssml = "<speak>{}</speak>".format(self.__trim_outputspeech(
-            speech_output=speech))
+        ssml = self.__build_ssml(speech)
         self.response.output_speech = SsmlOutputSpeech(
             ssml=ssml, play_behavior=play_behavior)
         return self
@@ -88,13 +103,12 @@ class ResponseFactory(object):
             access from self.response.
         :rtype: ResponseFactory
         """
-        ssml = "<speak>{}</speak>".format(self.__trim_outputspeech(
-            speech_output=reprompt))
-        output_speech = SsmlOutputSpeech(
-            ssml=ssml, play_behavior=play_behavior)
-        self.response.reprompt = Reprompt(output_speech=output_speech)
+        ssml = self.__build_ssml(reprompt)
+        response = self.response
         if not self.__is_video_app_launch_directive_present():
-            self.response.should_end_session = False
+            response.should_end_session = False
+        response.reprompt = Reprompt(output_speech=SsmlOutputSpeech(
+            ssml=ssml, play_behavior=play_behavior))
         return self
 
     def set_card(self, card):
@@ -123,13 +137,38 @@ class ResponseFactory(object):
             access from self.response.
         :rtype: ResponseFactory
         """
-        if self.response.directives is None:
-            self.response.directives = []
+        directives = self.response.directives
+        if directives is None:
+            directives = self.response.directives = []
 
         if (directive is not None and
-                directive.object_type == "VideoApp.Launch"):
+                directive.object_type == _VIDEO_APP_LAUNCH_TYPE):
+            self.response.should_end_session = None
+            self._has_video_launch = True
+        directives.append(directive)
+        return self
+
+    def add_directives(self, *directives):
+        # type: (Directive) -> 'ResponseFactory'
+        """Adds multiple directives to response, in the given order.
+
+        :param directives: the directives sent back to Alexa device.
+        :type directives: ask_sdk_model.directive.Directive
+        :return: response factory with partial response being built and
+            access from self.response.
+        :rtype: ResponseFactory
+        """
+        response_directives = self.response.directives
+        if response_directives is None:
+            response_directives = self.response.directives = []
+
+        if not self._has_video_launch and any(
+                directive is not None and
+                directive.object_type == _VIDEO_APP_LAUNCH_TYPE
+                for directive in directives):
             self.response.should_end_session = None
-        self.response.directives.append(directive)
+            self._has_video_launch = True
+        response_directives.extend(directives)
         return self
 
     def set_should_end_session(self, should_end_session):
@@ -163,22 +202,26 @@ class ResponseFactory(object):
         self.response.can_fulfill_intent = can_fulfill_intent
         return self
 
-    def __trim_outputspeech(self, speech_output=None):
+    def __build_ssml(self, speech_output):
         # type: (Union[str, None]) -> str
-        """Trims the output speech if it already has the
-        <speak></speak> tag.
+        """Wraps the output speech in the <speak></speak> tag, after
+        trimming the tag if the output speech already has it.
 
         :param speech_output: the output speech sent back to user.
-        :type speech_output: str
-        :return: the trimmed output speech.
-        :rtype: Union[bool, None]
+        :type speech_output: Union[str, None]
+        :return: the output speech wrapped in the speak tag.
+        :rtype: str
         """
         if speech_output is None:
-            return ""
+            return _EMPTY_SSML
         speech = speech_output.strip()
-        if speech.startswith("<speak>") and speech.endswith("</speak>"):
-            return speech[7:-8].strip()
-        return speech
+        if speech[:1] != "<":
+            # Most output speech isn't wrapped in any tag.
+            return _SPEAK_OPEN + speech + _SPEAK_CLOSE
+        if (speech.startswith(_SPEAK_OPEN) and
+                speech.endswith(_SPEAK_CLOSE)):
+            speech = speech[_SPEAK_OPEN_LEN:-_SPEAK_CLOSE_LEN].strip()
+        return _SPEAK_OPEN + speech + _SPEAK_CLOSE
 
     def __is_video_app_launch_directive_present(self):
         # type: () -> bool
@@ -188,14 +231,7 @@ class ResponseFactory(object):
             present or not.
         :rtype: bool
         """
-        if self.response.directives is None:
-            return False
-
-        for directive in self.response.directives:
-            if (directive is not None and
-                    directive.object_type == "VideoApp.Launch"):
-                return True
-        return False
+        return self._has_video_launch
 
 
 def get_plain_text_content(primary_text=None, secondary_text=None, tertiary_text=None):
@@ -213,12 +249,9 @@ def get_plain_text_content(primary_text=None, secondary_text=None, tertiary_text
     :return: Text Content instance with primary, secondary and tertiary
         text set as Plain Text objects.
     :rtype: TextContent
-    :raises: ValueError
     """
-    return get_text_content(
-        primary_text=primary_text, primary_text_type=PLAIN_TEXT_TYPE,
-        secondary_text=secondary_text, secondary_text_type=PLAIN_TEXT_TYPE,
-        tertiary_text=tertiary_text, tertiary_text_type=PLAIN_TEXT_TYPE)
+    return __build_text_content(
+        PlainText, primary_text, secondary_text, tertiary_text)
 
 
 def get_rich_text_content(primary_text=None, secondary_text=None, tertiary_text=None):
@@ -236,12 +269,9 @@ def get_rich_text_content(primary_text=None, secondary_text=None, tertiary_text=
     :return: Text Content instance with primary, secondary and tertiary
         text set as Rich Text objects.
     :rtype: TextContent
-    :raises: ValueError
     """
-    return get_text_content(
-        primary_text=primary_text, primary_text_type=RICH_TEXT_TYPE,
-        secondary_text=secondary_text, secondary_text_type=RICH_TEXT_TYPE,
-        tertiary_text=tertiary_text, tertiary_text_type=RICH_TEXT_TYPE)
+    return __build_text_content(
+        RichText, primary_text, secondary_text, tertiary_text)
 
 
 def get_text_content(
@@ -275,15 +305,12 @@ def get_text_content(
     :raises: ValueError
     """
     text_content = TextContent()
-    if primary_text:
-        text_content.primary_text = __set_text_field(
-            primary_text, primary_text_type)
-    if secondary_text:
-        text_content.secondary_text = __set_text_field(
-            secondary_text, secondary_text_type)
-    if tertiary_text:
-        text_content.tertiary_text = __set_text_field(
-            tertiary_text, tertiary_text_type)
+    for field, text, text_type in zip(
+            _TEXT_CONTENT_FIELDS,
+            (primary_text, secondary_text, tertiary_text),
+            (primary_text_type, secondary_text_type, tertiary_text_type)):
+        if text:
+            setattr(text_content, field, __set_text_field(text, text_type))
     return text_content
 
 
@@ -302,13 +329,39 @@ def __set_text_field(text, text_type):
     :rtype: object
     :raises: ValueError
     """
-    if text:
-        if text_type not in [PLAIN_TEXT_TYPE, RICH_TEXT_TYPE]:
-            raise ValueError("Invalid type provided: {}".format(text_type))
-
-        if text_type == PLAIN_TEXT_TYPE:
-            return PlainText(text=text)
-        else:
-            return RichText(text=text)
-    else:
+    if not text:
         return None
+
+    text_class = _TEXT_TYPE_CLASSES.get(text_type)
+    if text_class is None:
+        raise ValueError("Invalid type provided: {}".format(text_type))
+    return text_class(text=text)
+
+
+def __build_text_content(
+        text_class, primary_text, secondary_text, tertiary_text):
+    # type: (type, str, str, str) -> TextContent
+    """Helper method to build text content with all fields set to
+    the same text class, skipping the text type validation done in
+    :py:func:`get_text_content`.
+
+    :param text_class: Class used for every text field.
+    :type text_class: type
+    :param primary_text: Text for primary_text field
+    :type primary_text: str
+    :param secondary_text: Text for secondary_text field
+    :type secondary_text: str
+    :param tertiary_text: Text for tertiary_text field
+    :type tertiary_text: str
+    :return: Text Content instance with primary, secondary and tertiary
+        text set as objects of text_class.
+    :rtype: TextContent
+    """
+    text_content = TextContent()
+    if primary_text:
+        text_content.primary_text = text_class(text=primary_text)
+    if secondary_text:
+        text_content.secondary_text = text_class(text=secondary_text)
+    if tertiary_text:
+        text_content.tertiary_text = text_class(text=tertiary_text)
+    return text_content
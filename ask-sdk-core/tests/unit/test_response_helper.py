@@ -131,6 +131,27 @@ class TestResponseFactory(unittest.TestCase):
             "The add_directive() method of ResponseFactory fails to "
             "remove should_end_session value")
 
+    def test_add_multiple_directives(self):
+        response_factory = self.response_factory.add_directive(
+            directive=None).add_directives(None, None)
+
+        assert len(response_factory.response.directives) == 3, (
+            "The add_directives method of ResponseFactory fails to add "
+            "multiple directives")
+
+    def test_add_multiple_directives_with_video_app_launch_directive(self):
+        directive = LaunchDirective(video_item=VideoItem(
+            source=None, metadata=Metadata(title=None, subtitle=None)))
+        response_factory = self.response_factory.add_directives(
+            None, directive).ask(reprompt=None)
+
+        assert response_factory.response.directives == [None, directive], (
+            "The add_directives method of ResponseFactory fails to add "
+            "LaunchDirective")
+        assert response_factory.response.should_end_session is None, (
+            "The add_directives method of ResponseFactory fails to "
+            "remove should_end_session value")
+
     def test_set_should_end_session(self):
         response_factory = self.response_factory.set_should_end_session(False)
 
@@ -143,6 +164,8 @@ class TestResponseFactory(unittest.TestCase):
         speech_output2 = "  Hello World  "
         speech_output3 = "<speak>Hello World</speak>"
         speech_output4 = "<speak>  Hello World   </speak>"
+        speech_output5 = "  <speak>Hello World</speak>  "
+        speech_output6 = "<say-as interpret-as='digits'>12</say-as>"
 
         assert self.response_factory.speak(
             speech=speech_output1).response.output_speech.ssml == "<speak>Hello World</speak>", (
@@ -156,6 +179,13 @@ class TestResponseFactory(unittest.TestCase):
         assert self.response_factory.speak(
             speech=speech_output4).response.output_speech.ssml == "<speak>Hello World</speak>", (
             "The trim_outputspeech method fails to trim the outputspeech")
+        assert self.response_factory.speak(
+            speech=speech_output5).response.output_speech.ssml == "<speak>Hello World</speak>", (
+            "The trim_outputspeech method fails to trim the outputspeech")
+        assert self.response_factory.speak(
+            speech=speech_output6).response.output_speech.ssml == (
+            "<speak><say-as interpret-as='digits'>12</say-as></speak>"), (
+            "The trim_outputspeech method fails to wrap the outputspeech")
 
     def test_set_can_fulfill_intent(self):
         intent = CanFulfillIntent(
@@ -262,6 +292,18 @@ class TestPlainTextHelper(unittest.TestCase):
             "get_plain_text_content helper returned wrong text content " \
             "with primary text"
 
+    def test_build_all_texts(self):
+        text_content = TextContent(
+            primary_text=PlainText(text="primary"),
+            secondary_text=PlainText(text="secondary"),
+            tertiary_text=PlainText(text="tertiary"))
+
+        assert get_plain_text_content(
+            primary_text="primary", secondary_text="secondary",
+            tertiary_text="tertiary") == text_content, \
+            "get_plain_text_content helper returned wrong text content " \
+            "with all texts set"
+
 
 class TestRichTextHelper(unittest.TestCase):
     def test_build_primary_text(self):
@@ -273,3 +315,15 @@ class TestRichTextHelper(unittest.TestCase):
         assert get_rich_text_content(primary_text=text_val) == text_content, \
             "get_rich_text_content helper returned wrong text content " \
             "with primary text"
+
+    def test_build_all_texts(self):
+        text_content = TextContent(
+            primary_text=RichText(text="primary"),
+            secondary_text=RichText(text="secondary"),
+            tertiary_text=RichText(text="tertiary"))
+
+        assert get_rich_text_content(
+            primary_text="primary", secondary_text="secondary",
+            tertiary_text="tertiary") == text_content, \
+            "get_rich_text_content helper returned wrong text content " \
+            "with all texts set"